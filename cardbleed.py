@@ -1,42 +1,132 @@
 # -*- coding: UTF-8 -*-
 import argparse
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import itertools
 import logging
 import math
 import os
 import pathlib
+import shutil
+import tempfile
+import threading
+import weakref
 
-from pdf2image import convert_from_bytes
+import numpy as np
+from pdf2image import convert_from_path, pdfinfo_from_path
 from PIL import Image, UnidentifiedImageError
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# The pyvips package raises OSError rather than ImportError when it is
+# installed without the libvips shared library.
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
 HANDLER = logging.StreamHandler()
 LOGGER = logging.getLogger()
 LOGGER.setLevel(logging.INFO)
 LOGGER.addHandler(HANDLER)
 
-
-def _mirror_right(im):
+# libvips reports routine progress at info level, which would otherwise
+# reach the handler above.
+logging.getLogger("pyvips").setLevel(logging.WARNING)
+
+# Maps each edge to the array axis across which an image is mirrored
+# and whether the mirror precedes the original along that axis.
+_EDGE_TRANSFORMS = {
+        "top": (0, True),
+        "bottom": (0, False),
+        "left": (1, True),
+        "right": (1, False),
+    }
+
+_LEGAL_EDGES = frozenset(_EDGE_TRANSFORMS)
+
+# Pillow decodes an opened image the first time its pixels are needed,
+# and that decoding must not run in several threads at once. Maps the
+# id of each image passed to `_load` to a lock of its own, so different
+# images can still be decoded in parallel. Images aren't hashable, so
+# entries are dropped when their image is garbage collected instead.
+_LOAD_LOCKS = {}
+_LOAD_LOCKS_LOCK = threading.Lock()
+
+# Maps each edge to the change stripping it makes to the (left, upper,
+# right, lower) box of an image.
+_EDGE_STRIP = {
+        "top": (0, 1, 0, 0),
+        "bottom": (0, 0, 0, -1),
+        "left": (1, 0, 0, 0),
+        "right": (0, 0, -1, 0),
+    }
+
+# OpenCV orders color channels BGR rather than RGB, so maps each image
+# mode OpenCV can write to the name of the conversion it needs first.
+_CV2_CONVERSIONS = {
+        "L": None,
+        "RGB": "COLOR_RGB2BGR",
+        "RGBA": "COLOR_RGBA2BGRA",
+    }
+
+
+def _wrap(a, im):
     """
-    Create image plus its mirror across original image right edge
+    Wrap array as image with the same mode and palette as `im`
 
     Args:
-        im (PIL.Image): Image to mirror.
+        a (numpy.ndarray): Pixel data laid out as `numpy.asarray(im)`
+            would produce.
+        im (PIL.Image): Image supplying mode and palette.
 
     Returns:
         PIL.Image
     """
-    base_w, base_h = im.size
-
-    mirrored_im = im.transpose(Image.FLIP_LEFT_RIGHT)
+    if im.mode == "1":
+        # Bilevel images come out of numpy as bool arrays, which
+        # `fromarray` already maps back to mode "1".
+        result_im = Image.fromarray(a)
+    else:
+        # Everything built in this module is already C-contiguous, in
+        # which case PIL wraps the array's own buffer, without copying
+        # it, for every mode it stores the same way numpy does.
+        a = np.ascontiguousarray(a)
+        base_h, base_w = a.shape[:2]
 
-    result_im = Image.new(mode=im.mode, size=(2 * base_w, base_h))
+        result_im = Image.frombuffer(im.mode, (base_w, base_h), a, "raw", im.mode, 0, 1)
 
-    result_im.paste(im)
-    result_im.paste(mirrored_im, box=(base_w, 0))
+    if im.palette is not None:
+        result_im.putpalette(im.getpalette())
 
     return result_im
 
 
+def _load(im):
+    """
+    Decode image pixels if they haven't been already
+
+    Safe to call from several threads with the same image.
+
+    Args:
+        im (PIL.Image): Image to load.
+    """
+    with _LOAD_LOCKS_LOCK:
+        lock = _LOAD_LOCKS.get(id(im))
+
+        if lock is None:
+            lock = _LOAD_LOCKS[id(im)] = threading.Lock()
+            weakref.finalize(im, _LOAD_LOCKS.pop, id(im), None)
+
+    with lock:
+        im.load()
+
+
 def mirror_across_edge(im, edge):
     """
     Create image plus its mirror attached across specified edge
@@ -49,22 +139,31 @@ def mirror_across_edge(im, edge):
     Returns:
         PIL.Image
     """
-    edj = edge.lower()
+    edj = edge.casefold()
 
-    transforms = {
-            "top": [Image.ROTATE_270, Image.ROTATE_90],
-            "bottom": [Image.ROTATE_90, Image.ROTATE_270],
-            "left": [Image.ROTATE_180, Image.ROTATE_180]
-        }
+    if edj not in _EDGE_TRANSFORMS:
+        raise ValueError("Invalid value for 'edge'.")
+
+    axis, mirror_first = _EDGE_TRANSFORMS[edj]
 
-    if edj in transforms.keys():
-        rot_im = im.transpose(transforms[edj][0])
-        mirrored_im = _mirror_right(rot_im)
-        result_im = mirrored_im.transpose(transforms[edj][1])
-    elif edj == "right":
-        result_im = _mirror_right(im)
+    _load(im)
+    a = np.asarray(im)
+    mirrored = np.flip(a, axis=axis)
+
+    shape = list(a.shape)
+    shape[axis] *= 2
+    out = np.empty(shape, dtype=a.dtype)
+
+    first, second = np.split(out, 2, axis=axis)
+
+    if mirror_first:
+        first[...] = mirrored
+        second[...] = a
     else:
-        raise ValueError("Invalid value for 'edge'.")
+        first[...] = a
+        second[...] = mirrored
+
+    result_im = _wrap(out, im)
 
     return result_im
 
@@ -82,24 +181,116 @@ def frill(im):
     Returns:
         PIL.Image
     """
-    # This function ends up creating an image that is a set of 3x3
-    # transposes of the original. I will start by creating the middle
-    # set of three images, then mirror across the top and bottom of
-    # that image.
-    
     base_w, base_h = im.size
 
-    res_im = mirror_across_edge(im, edge="left")
-    res_im = mirror_across_edge(res_im, edge="right")
-    res_im = res_im.crop((0, 0, 3 * base_w, base_h))
+    res_im = frill_crop(im, (0, 0, 3 * base_w, 3 * base_h))
+
+    return res_im
+
+
+def frill_crop(im, box):
+    """
+    Create region of frill image of card image
 
-    res_im = mirror_across_edge(res_im, edge="top")
-    res_im = mirror_across_edge(res_im, edge="bottom")
-    res_im = res_im.crop((0, 0, 3 * base_w, 3 * base_h))
+    Equivalent to `frill(im).crop(box)`, except that only the pixels
+    within `box` are ever created.
+
+    Args:
+        im (PIL.Image): From which to create frill.
+        box (tuple): Region of the frill as a (left, upper, right,
+            lower) pixel-coordinate tuple, in the same convention as
+            `PIL.Image.crop`.
+
+    Returns:
+        PIL.Image
+
+    Raises:
+        ValueError: If `box` doesn't lie within the frill.
+    """
+    _load(im)
+    res_im = _wrap(_frill_np(np.asarray(im), box), im)
 
     return res_im
 
 
+def _frill_np(a, box):
+    """
+    Create region of frill array of card image array
+
+    See `frill_crop`.
+
+    Args:
+        a (numpy.ndarray): Image array from which to create frill.
+        box (tuple): Region of the frill as a (left, upper, right,
+            lower) pixel-coordinate tuple.
+
+    Returns:
+        numpy.ndarray
+    """
+    # The frill is a 3x3 grid of tiles. The center tile is the
+    # original, the tiles to its left and right are mirrored
+    # left-right, the tiles above and below are mirrored top-bottom,
+    # and the corner tiles are mirrored both ways. Every tile is a
+    # reflection, so the region is assembled from reversed views of a
+    # single array without rotating anything. Tiles that don't
+    # intersect the box are skipped entirely.
+    base_h, base_w = a.shape[:2]
+    left, upper, right, lower = box
+
+    if not (0 <= left <= right <= 3 * base_w and 0 <= upper <= lower <= 3 * base_h):
+        raise ValueError("box {} must lie within the frill.".format(box))
+
+    variants = {
+            (False, False): a,
+            (True, False): a[:, ::-1],
+            (False, True): a[::-1, :],
+            (True, True): a[::-1, ::-1],
+        }
+
+    out = np.empty((lower - upper, right - left) + a.shape[2:], dtype=a.dtype)
+
+    for i, j in itertools.product(range(3), repeat=2):
+        tile_x, tile_y = j * base_w, i * base_h
+
+        x0 = max(left, tile_x)
+        x1 = min(right, tile_x + base_w)
+        y0 = max(upper, tile_y)
+        y1 = min(lower, tile_y + base_h)
+
+        if x0 >= x1 or y0 >= y1:
+            continue
+
+        variant = variants[(j != 1, i != 1)]
+        out[y0 - upper:y1 - upper, x0 - left:x1 - left] = \
+            variant[y0 - tile_y:y1 - tile_y, x0 - tile_x:x1 - tile_x]
+
+    return out
+
+
+def _check_out_of_bounds(val, target, val_name, target_name):
+    """
+    Check value is between one and three times target
+
+    Args:
+        val (float): Value to check.
+        target (float): Value against which to check.
+        val_name (str): Name of `val` used in error message.
+        target_name (str): Name of `target` used in error message.
+
+    Raises:
+        ValueError: If `val` isn't within the proper range.
+    """
+    err_dict = {"val": val, "target": target, "val_name": val_name, "target_name": target_name}
+
+    if val < target:
+        err_msg = "{val_name} ({val}) must be greater than image {target_name} ({target})"
+        raise ValueError(err_msg.format(**err_dict))
+
+    elif val > 3 * target:
+        err_msg = "{val_name} ({val}) must be less than 3 times image {target_name} ({target})"
+        raise ValueError(err_msg.format(**err_dict))
+
+
 def add_bleed(im, width=None, height=None):
     """
     Add bleed border around image using a frill
@@ -116,13 +307,76 @@ def add_bleed(im, width=None, height=None):
             be the same height as `im`.
 
     Returns:
-        PIL.Image
+        PIL.Image: If no bleed needs to be added, this is `im` itself
+            rather than a copy.
 
     Raises:
         ValueError: If the width and height values aren't within the
             proper range.
     """
-    base_w, base_h = im.size
+    if width in (None, im.width) and height in (None, im.height):
+        return im
+
+    _load(im)
+    res_im = _wrap(_add_bleed_np(np.asarray(im), width, height), im)
+
+    return res_im
+
+
+def _add_bleed_np(a, width=None, height=None):
+    """
+    Add bleed border around image array using a frill
+
+    See `add_bleed`.
+
+    Args:
+        a (numpy.ndarray): Image array to which bleed will be added.
+        width (int): Width, in pixels, of the resulting array.
+        height (int): Height, in pixels, of the resulting array.
+
+    Returns:
+        numpy.ndarray: If no bleed needs to be added, this is `a`
+            itself rather than a copy.
+    """
+    base_h, base_w = a.shape[:2]
+
+    border_w, border_h = _bleed_borders((base_w, base_h), width, height)
+
+    # There's nothing to add, so skip building any of the frill. When
+    # only one of the borders is zero, `_frill_np` already skips the
+    # tiles above and below or to the sides of the original.
+    if border_w == 0 and border_h == 0:
+        return a
+
+    box = (base_w - border_w,
+        base_h - border_h,
+        2 * base_w + border_w,
+        2 * base_h + border_h)
+
+    res = _frill_np(a, box)
+
+    return res
+
+
+def _bleed_borders(size, width=None, height=None):
+    """
+    Width of bleed border on each side of image
+
+    Args:
+        size (tuple): (width, height) of the image in pixels.
+        width (int): Width, in pixels, of the image with bleed. See
+            `add_bleed`.
+        height (int): Height, in pixels, of the image with bleed. See
+            `add_bleed`.
+
+    Returns:
+        tuple: (horizontal, vertical) border width in pixels.
+
+    Raises:
+        ValueError: If the width and height values aren't within the
+            proper range.
+    """
+    base_w, base_h = size
 
     if width is None:
         w = base_w
@@ -134,33 +388,13 @@ def add_bleed(im, width=None, height=None):
     else:
         h = int(height)
 
-    def check_out_of_bounds(val, target, name):
-        err_dict = {"val": val, "target": target, "name": name}
-
-        if val < target:
-            err_msg = "{name} ({val}) must be greater than image pixel-{name} ({target})"
-            raise ValueError(err_msg.format(**err_dict))
-    
-        elif val > 3 * target:
-            err_msg = "{name} ({val}) must be less than and 3 times image pixel-{name} ({target})"
-            raise ValueError(err_msg.format(**err_dict))
-
-    check_out_of_bounds(width, base_w, "width")
-    check_out_of_bounds(height, base_h, "height")
-
-    frill_im = frill(im)
+    _check_out_of_bounds(w, base_w, "width", "pixel-width")
+    _check_out_of_bounds(h, base_h, "height", "pixel-height")
 
     border_w = int((w - base_w)/2)
     border_h = int((h - base_h)/2)
 
-    box = (base_w - border_w,
-        base_h - border_h,
-        2 * base_w + border_w,
-        2 * base_h + border_h)
-
-    res_im = frill_im.crop(box=box)
-
-    return res_im
+    return border_w, border_h
 
 
 def add_dimensioned_bleed(im, width, height, bleed_width=None, bleed_height=None, crop_strategy="smaller", **_):
@@ -192,13 +426,48 @@ def add_dimensioned_bleed(im, width, height, bleed_width=None, bleed_height=None
             function.
 
     Returns:
-        PIL.Image
+        PIL.Image: If no bleed needs to be added, this is `im` itself
+            rather than a copy.
 
     Raises:
         ValueError: If the bleed_width and bleed_height values aren't
             within the proper range.
     """
-    base_w, base_h = im.size
+    bleed_width_pixels, bleed_height_pixels = _bleed_pixels(im.size, width, height, bleed_width, bleed_height, crop_strategy)
+
+    res_im = add_bleed(im, width=bleed_width_pixels, height=bleed_height_pixels)
+
+    return res_im
+
+
+@functools.lru_cache(maxsize=16)
+def _bleed_pixels(size, width, height, bleed_width=None, bleed_height=None, crop_strategy="smaller"):
+    """
+    Convert bleed linear spatial dimensions to pixels
+
+    See `add_dimensioned_bleed`. The result only depends on the image
+    size, so it is cached: every page of a typical deck has the same
+    size and is converted using the same arguments.
+
+    Args:
+        size (tuple): (width, height) of the image in pixels.
+        width (float): Width of image in a linear spatial unit.
+        height (float): Height of image in a linear spatial unit.
+        bleed_width (float): Width of full bleed in linear spatial
+            unit.
+        bleed_height (float): height of full bleed in linear spatial
+            unit.
+        crop_strategy (str): Either "smaller" or "larger"
+            (case-insensitive).
+
+    Returns:
+        tuple: (width, height) of the full bleed in pixels.
+
+    Raises:
+        ValueError: If the bleed_width and bleed_height values aren't
+            within the proper range.
+    """
+    base_w, base_h = size
 
     if bleed_width is None:
         bleed_w = width
@@ -210,19 +479,8 @@ def add_dimensioned_bleed(im, width, height, bleed_width=None, bleed_height=None
     else:
         bleed_h = bleed_height
 
-    def check_out_of_bounds(val, target, val_name, target_name):
-        err_dict = {"val": val, "target": target, "val_name": val_name, "target_name": target_name}
-
-        if val < target:
-            err_msg = "{val_name} ({val}) must be greater than image {target_name} ({target})"
-            raise ValueError(err_msg.format(**err_dict))
-    
-        elif val > 3 * target:
-            err_msg = "{val_name} ({val}) must be less than 3 times image {target_name} ({target})"
-            raise ValueError(err_msg.format(**err_dict))
-
-    check_out_of_bounds(bleed_w, width, "bleed_width", "width")
-    check_out_of_bounds(bleed_h, height, "bleed_height", "height")
+    _check_out_of_bounds(bleed_w, width, "bleed_width", "width")
+    _check_out_of_bounds(bleed_h, height, "bleed_height", "height")
 
     cs = crop_strategy.lower()
     if cs not in {"larger", "smaller"}:
@@ -243,12 +501,10 @@ def add_dimensioned_bleed(im, width, height, bleed_width=None, bleed_height=None
     else:
         ppi = ppi_larger
 
-    bleed_width_pixels = int(bleed_width * ppi)
-    bleed_height_pixels = int(bleed_height * ppi)
+    bleed_width_pixels = int(bleed_w * ppi)
+    bleed_height_pixels = int(bleed_h * ppi)
 
-    res_im = add_bleed(im, width=bleed_width_pixels, height=bleed_height_pixels)
-
-    return res_im
+    return bleed_width_pixels, bleed_height_pixels
 
 
 def strip_pixels(im, *args):
@@ -263,41 +519,84 @@ def strip_pixels(im, *args):
     Returns:
         PIL.Image
     """
-    edjs = {e.lower() for e in args}
-    legal_values = {"top", "bottom", "left", "right"}
-
-    if not edjs <= legal_values:
-        raise ValueError("Edge must be 'top', 'bottom', 'left', or 'right'.")
+    # Cropping copies the remaining pixels once, whereas a round trip
+    # through numpy would copy them both into and out of the array.
+    box = _strip_box(im.size, *args)
+    _load(im)
+    result = im.crop(box)
 
-    base_w, base_h = im.size
+    return result
 
-    left = 0
-    upper = 0
-    right = base_w
-    lower = base_h
 
-    if "left" in edjs:
-        left += 1
+def _strip_np(a, *args):
+    """
+    Remove line of pixels from specified edge of image array
 
-    if "upper" in edjs:
-        upper += 1
+    See `strip_pixels`. The result is a view of `a`, so no pixels are
+    copied.
 
-    if "right"  in edjs:
-        right -= 1
+    Args:
+        a (numpy.ndarray): Image array from which to strip pixels.
+        args (str): Edge from which to remove pixels.
 
-    if "bottom" in edjs:
-        lower -= 1
+    Returns:
+        numpy.ndarray
+    """
+    base_h, base_w = a.shape[:2]
 
-    box = (left, upper, right, lower)
-    result = im.crop(box)
+    left, upper, right, lower = _strip_box((base_w, base_h), *args)
+    result = a[upper:lower, left:right]
 
     return result
 
 
+def _strip_box(size, *args):
+    """
+    Box remaining after stripping pixels from specified edge of image
+
+    Args:
+        size (tuple): (width, height) of the image.
+        args (str): Edge from which to remove pixels. Can be "top",
+            "bottom", "left", or "right" (case insensitive).
+
+    Returns:
+        tuple: (left, upper, right, lower) pixel coordinates, in the
+            same convention as `PIL.Image.crop`.
+    """
+    edjs = {e.casefold() for e in args}
+
+    if not edjs <= _LEGAL_EDGES:
+        raise ValueError("Edge must be 'top', 'bottom', 'left', or 'right'.")
+
+    base_w, base_h = size
+
+    deltas = [_EDGE_STRIP[edj] for edj in edjs]
+    box = tuple(sum(coords) for coords in zip((0, 0, base_w, base_h), *deltas))
+
+    return box
+
+
+def _absolute_path(path):
+    """
+    Absolute path for a command line argument
+
+    Args:
+        path (str): Path, possibly relative to the working directory.
+
+    Returns:
+        pathlib.Path
+    """
+    return pathlib.Path(path).absolute()
+
+
+@functools.lru_cache(maxsize=1)
 def create_parser():
     """
     Factory to create ArgumentParser object defining interface
 
+    The parser is only built on the first call; every call returns the
+    same object.
+
     Returns:
         argparse.ArgumentParser
     """
@@ -342,12 +641,28 @@ def create_parser():
         choices={"top", "bottom", "left", "right"},
         help="Remove single strip of pixels from specified side of image before adding the bleed.")
 
+    parser.add_argument("-j", "--jobs",
+        type=int,
+        help="Number of pages to process in parallel. Defaults to the number of CPUs, or to 1 with the vips backend, which already spreads each page over every CPU.")
+
+    parser.add_argument("--compress_level",
+        default=1,
+        type=int,
+        choices=range(10),
+        metavar="{0-9}",
+        help="zlib compression level of resulting PNG images. Higher levels give somewhat smaller files but take considerably longer to write.")
+
+    parser.add_argument("--backend",
+        default="pil",
+        choices={"pil", "vips"},
+        help="Image processing library to use. The vips backend requires pyvips and keeps memory use low on very large images.")
+
     parser.add_argument("input_file",
         type=argparse.FileType("rb"),
         help="Location of file containing card image(s).")
 
     parser.add_argument("output_directory",
-        type=lambda p: pathlib.Path(p).absolute(),
+        type=_absolute_path,
         help="Directory to which images with bleeds should be written. Directory must exist prior to running this program.")
 
     return parser
@@ -380,38 +695,401 @@ def output_filenames(parent_dir=".", suffix="", pad_width=0):
         pathlib.Path: Output filename.
     """
     sides = itertools.cycle(("front", "back"))
-    slug = "{:0{pad_width}d}_card{card_no}_{side}"
 
-    for file_no, side in zip(itertools.count(), sides):
-        card_no = int(file_no/2)
-        filename = slug.format(file_no, card_no=card_no, pad_width=pad_width, side=side)
+    parent = pathlib.Path(parent_dir)
 
+    if suffix:
         ext = "." + suffix.lstrip(".")
-        path = pathlib.Path(parent_dir, filename).with_suffix(ext)
-        yield path
+    else:
+        ext = ""
 
+    for file_no, side in zip(itertools.count(), sides):
+        card_no = file_no // 2
+        filename = f"{file_no:0{pad_width}d}_card{card_no}_{side}{ext}"
 
-if __name__ == "__main__":
+        yield parent / filename
+
+
+def _save_png(a, im, filename, compress_level=1):
+    """
+    Save image array as PNG
+
+    OpenCV's PNG encoder is used when it is installed and supports the
+    image mode; PIL is used otherwise.
+
+    Args:
+        a (numpy.ndarray): Pixel data laid out as `numpy.asarray(im)`
+            would produce.
+        im (PIL.Image): Image supplying mode and palette.
+        filename (pathlib.Path): Location to which to save image.
+        compress_level (int): zlib compression level, from 0 (none)
+            to 9 (most).
+    """
+    if cv2 is None or im.mode not in _CV2_CONVERSIONS:
+        _wrap(a, im).save(filename, compress_level=compress_level, optimize=False)
+        return
+
+    conversion = _CV2_CONVERSIONS[im.mode]
+    if conversion is not None:
+        a = cv2.cvtColor(a, getattr(cv2, conversion))
+
+    _imwrite_png(a, filename, compress_level)
+
+
+def _imwrite_png(a, filename, compress_level=1):
+    """
+    Save OpenCV image array as PNG using OpenCV
+
+    Args:
+        a (numpy.ndarray): Grayscale, BGR, or BGRA pixel data.
+        filename (pathlib.Path): Location to which to save image.
+        compress_level (int): zlib compression level, from 0 (none)
+            to 9 (most).
+    """
+    if not cv2.imwrite(str(filename), a, [cv2.IMWRITE_PNG_COMPRESSION, compress_level]):
+        raise OSError("Unable to write {}".format(filename))
+
+
+def _imread_page(page):
+    """
+    Read page passed to a worker process using OpenCV
+
+    Args:
+        page (str or tuple): See `_process_page`.
+
+    Returns:
+        numpy.ndarray: Grayscale or BGR pixel data, as OpenCV lays it
+            out. `None` if OpenCV isn't installed, the page isn't a
+            file, or the file isn't an 8-bit grayscale or color image
+            without alpha.
+    """
+    if cv2 is None or isinstance(page, tuple):
+        return None
+
+    a = cv2.imread(str(page), cv2.IMREAD_UNCHANGED)
+
+    if a is None or a.dtype != np.uint8:
+        return None
+
+    # OpenCV premultiplies color by alpha when it reads some formats,
+    # TIFF included, so images with alpha are left to PIL.
+    if a.ndim == 3 and a.shape[2] != 3:
+        return None
+
+    return a
+
+
+def _open_page(page):
+    """
+    Open page passed to a worker process as a `PIL.Image`
+
+    Args:
+        page (str or tuple): See `_process_page`.
+
+    Returns:
+        PIL.Image
+    """
+    if isinstance(page, tuple):
+        mode, size, data, palette = page
+
+        im = Image.frombytes(mode, size, data)
+        if palette is not None:
+            im.putpalette(palette)
+    else:
+        im = Image.open(page)
+
+    return im
+
+
+def _page_digest(page):
+    """
+    Hash of rendered page file contents
+
+    Args:
+        page (str): Location of rendered page.
+
+    Returns:
+        bytes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    # Rendered pages are hashed a block at a time so that they are
+    # never held in memory whole.
+    with open(page, "rb") as f:
+        for block in iter(functools.partial(f.read, 1 << 20), b""):
+            digest.update(block)
+
+    return digest.digest()
+
+
+def _process_pdf_page(pdf_path, page_no, dpi, process_page, output_file, *args):
+    """
+    Render a single PDF page to disk, then process it
+
+    Card decks often repeat pages, e.g. the same back for every card,
+    so only the first worker to render a page with given contents
+    processes it. The others leave its result to be copied. The
+    rendered page is deleted before returning.
+
+    Args:
+        pdf_path (str): Location of PDF file, in the directory to which
+            the page is rendered.
+        page_no (int): Number of page to render, counting from 1.
+        dpi (int): Resolution at which to render page.
+        process_page (callable): `_process_page` or
+            `_process_page_vips`.
+        output_file (pathlib.Path): Location to which to save result.
+        args: Remaining arguments of `process_page`.
+
+    Returns:
+        tuple: (digest, processed), the hash of the rendered page and
+            whether it was processed here rather than left to be copied.
+    """
+    tmp_dir = os.path.dirname(pdf_path)
+
+    # pdftocairo writes uncompressed TIFF, which is as cheap to read
+    # back as PPM, but unlike PPM can be read by every libvips build.
+    page, = convert_from_path(pdf_path, dpi=dpi, first_page=page_no, last_page=page_no, output_folder=tmp_dir, paths_only=True, fmt="tiff", use_pdftocairo=True)
+
+    try:
+        digest = _page_digest(page)
+
+        # Creating the file fails if another worker already has.
+        try:
+            os.close(os.open(os.path.join(tmp_dir, digest.hex()), os.O_CREAT | os.O_EXCL))
+        except FileExistsError:
+            return digest, False
+
+        process_page(page, output_file, *args)
+    finally:
+        os.remove(page)
+
+    return digest, True
+
+
+def _process_page(page, output_file, strip, dims, compress_level, compute_lock=None):
+    """
+    Strip, add bleed to, and save a single page
+
+    Usually runs in a worker process, so the page is passed as a
+    filename or raw pixel data rather than as a `PIL.Image`.
+
+    Args:
+        page (str or tuple): Location of the page image, or (mode,
+            size, data, palette) of the page image as given by
+            `PIL.Image.mode`, `PIL.Image.size`, `PIL.Image.tobytes()`,
+            and `PIL.Image.getpalette()`.
+        output_file (pathlib.Path): Location to which to save result.
+        strip (list): Edges passed to `strip_pixels`.
+        dims (dict): Linear spatial dimensions and crop strategy as
+            passed to `add_dimensioned_bleed`.
+        compress_level (int): zlib compression level of saved PNG.
+        compute_lock (threading.Lock): Held while loading the page and
+            adding the bleed, but not while saving it. Pages processed
+            on threads sharing a lock are worked on one at a time, but
+            each one is saved while the next is being worked on.
+
+    Returns:
+        pathlib.Path: `output_file`
+    """
+    if compute_lock is None:
+        compute_lock = contextlib.nullcontext()
+
+    with compute_lock:
+        # When OpenCV reads the page, the pixel data is left in its BGR
+        # order all the way to the output file: mirroring and cropping
+        # don't care about the order of the channels.
+        a = _imread_page(page)
+        im = None
+
+        if a is None:
+            im = _open_page(page)
+            a = np.asarray(im)
+
+        # Pixel data stays a single numpy array from here until it is
+        # written out.
+        a = _strip_np(a, *strip)
+
+        base_h, base_w = a.shape[:2]
+        bleed_width_pixels, bleed_height_pixels = _bleed_pixels((base_w, base_h), **dims)
+        a = _add_bleed_np(a, width=bleed_width_pixels, height=bleed_height_pixels)
+
+    if im is None:
+        _imwrite_png(a, output_file, compress_level)
+    else:
+        _save_png(a, im, output_file, compress_level)
+
+    return output_file
+
+
+def _process_page_vips(page, output_file, strip, dims, compress_level):
+    """
+    Strip, add bleed to, and save a single page using libvips
+
+    libvips evaluates the whole strip, bleed, and save pipeline lazily,
+    a strip of the image at a time, so the full image with bleed is
+    never held in memory.
+
+    Args:
+        page (str or tuple): See `_process_page`.
+        output_file (pathlib.Path): Location to which to save result.
+        strip (list): Edges passed to `strip_pixels`.
+        dims (dict): Linear spatial dimensions and crop strategy as
+            passed to `add_dimensioned_bleed`.
+        compress_level (int): zlib compression level of saved PNG.
+
+    Returns:
+        pathlib.Path: `output_file`
+    """
+    if isinstance(page, tuple):
+        # libvips has no equivalent of the other PIL modes, such as
+        # palette or bilevel images, so those pages are processed with
+        # PIL to keep their mode.
+        if page[0] not in {"L", "LA", "RGB", "RGBA"}:
+            return _process_page(page, output_file, strip, dims, compress_level)
+
+        pil_im = _open_page(page)
+        bands = len(pil_im.getbands())
+        im = pyvips.Image.new_from_memory(pil_im.tobytes(), pil_im.width, pil_im.height, bands, "uchar")
+    else:
+        im = pyvips.Image.new_from_file(page)
+
+    left, upper, right, lower = _strip_box((im.width, im.height), *strip)
+    im = im.crop(left, upper, right - left, lower - upper)
+
+    bleed_width_pixels, bleed_height_pixels = _bleed_pixels((im.width, im.height), **dims)
+    border_w, border_h = _bleed_borders((im.width, im.height), bleed_width_pixels, bleed_height_pixels)
+
+    # Mirror extension reflects the image about its edges, edge pixel
+    # included, which is exactly the frill for borders no wider than
+    # the image itself.
+    im = im.embed(border_w, border_h, im.width + 2 * border_w, im.height + 2 * border_h, extend="mirror")
+
+    im.pngsave(str(output_file), compression=compress_level)
+
+    return output_file
+
+
+def _page_executor(backend, jobs):
+    """
+    Executor and page processing function for a number of parallel jobs
+
+    Args:
+        backend (str): Image processing library, "pil" or "vips".
+        jobs (int): Number of pages to process in parallel.
+
+    Returns:
+        tuple: (executor, process_page), where `process_page` is the
+            function to submit to `executor` for each page.
+    """
+    if backend == "vips":
+        process_page = _process_page_vips
+    else:
+        process_page = _process_page
+
+    if jobs == 1 and backend == "vips":
+        # libvips already spreads the work on each page over every CPU,
+        # so pages are processed strictly one after another.
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    elif jobs == 1:
+        # Process pages here rather than in a worker process, a page at
+        # a time. PNG encoding releases the GIL, so a second thread
+        # lets each page be saved while the next one is worked on.
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        if process_page is _process_page:
+            process_page = functools.partial(process_page, compute_lock=threading.Lock())
+    elif backend == "vips":
+        # Share the CPUs out between the worker processes rather than
+        # giving each one its own full-size libvips thread pool.
+        concurrency = max(1, (os.cpu_count() or 1) // jobs)
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=pyvips.concurrency_set, initargs=(concurrency,))
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+
+    return executor, process_page
+
+
+def main():
+    """
+    Command line entry point
+    """
     parser = create_parser()
     args = parser.parse_args()
 
+    if args.jobs is None:
+        args.jobs = 1 if args.backend == "vips" else os.cpu_count() or 1
+
+    if args.jobs < 1:
+        parser.error("argument -j/--jobs: must be at least 1")
+
+    if args.backend == "vips" and pyvips is None:
+        parser.error("the vips backend requires pyvips to be installed")
+
     logger = logging.getLogger("main")
     if args.quiet:
         logger.propagate = False
 
-    try:
-        img = Image.open(args.input_file)
-        imgs = [img,]
-    except UnidentifiedImageError:
-        args.input_file.seek(0)
-        imgs = convert_from_bytes(args.input_file.read(), dpi=args.dpi)
+    dim_names = ("width", "height", "bleed_width", "bleed_height", "crop_strategy")
+    dims = {name: getattr(args, name) for name in dim_names}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        try:
+            img = Image.open(args.input_file)
+        except UnidentifiedImageError:
+            # Each page is rendered by the worker that processes it, so
+            # pages are rendered in parallel and only those currently
+            # being worked on are ever on disk.
+            img = None
+            pdf_path = os.path.join(tmp_dir, "input.pdf")
+
+            args.input_file.seek(0)
+            with open(pdf_path, "wb") as f:
+                shutil.copyfileobj(args.input_file, f)
+
+            page_count = pdfinfo_from_path(pdf_path)["Pages"]
+        else:
+            page = (img.mode, img.size, img.tobytes(), img.getpalette())
+            page_count = 1
 
-    pad_width = int(math.log10(len(imgs))) + 1
+        pad_width = int(math.log10(page_count)) + 1
 
-    filenames = output_filenames(parent_dir=args.output_directory, suffix=".png", pad_width=pad_width)
+        filenames = output_filenames(parent_dir=args.output_directory, suffix=".png", pad_width=pad_width)
 
-    for im, output_file in zip(imgs, filenames):
-        logger.info(output_file)
-        stripped = strip_pixels(im, *args.strip)
-        result = add_dimensioned_bleed(stripped, **vars(args))
-        result.save(output_file)
+        # There is no point starting more workers than there are pages.
+        executor, process_page = _page_executor(args.backend, min(args.jobs, page_count))
+
+        with executor:
+            if img is not None:
+                output_file = next(filenames)
+                executor.submit(process_page, page, output_file, args.strip, dims, args.compress_level).result()
+                logger.info(output_file)
+                return
+
+            jobs = []
+
+            for page_no, output_file in zip(range(1, page_count + 1), filenames):
+                future = executor.submit(_process_pdf_page, pdf_path, page_no, args.dpi, process_page, output_file, args.strip, dims, args.compress_level)
+                jobs.append((future, output_file))
+
+            # Pages left to be copied are only copied once every page
+            # has been processed, as the page they repeat may come
+            # after them.
+            processed = {}
+            copies = []
+
+            for future, output_file in jobs:
+                digest, was_processed = future.result()
+
+                if was_processed:
+                    processed[digest] = output_file
+                    logger.info(output_file)
+                else:
+                    copies.append((digest, output_file))
+
+            for digest, output_file in copies:
+                shutil.copyfile(processed[digest], output_file)
+                logger.info(output_file)
+
+if __name__ == "__main__":
+    main()